@@ -1732,11 +1732,12 @@ public:
             for (int y = 0; y < height; ++y) {
                 char* d = (char*)data + y * ystride;
                 for (int x = 0; x < width; ++x, d += xstride) {
-                    vfloat4 color;
-                    char* dc = d;
+                    vfloat4 color = vfloat4::Zero();
+                    char* dc      = d;
                     for (int c = 0; c < channels; ++c, dc += chanstride)
                         color[c] = *(float*)dc;
                     vfloat4 xcolor = color * m_M;
+                    dc             = d;
                     for (int c = 0; c < channels; ++c, dc += chanstride)
                         *(float*)dc = xcolor[c];
                 }
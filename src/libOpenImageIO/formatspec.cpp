@@ -4,6 +4,7 @@
 
 #include <cstdio>
 #include <cstdlib>
+#include <memory>
 #include <regex>
 #include <sstream>
 
@@ -380,25 +381,89 @@ ImageSpec::attribute(string_view name, ustring value)
 
 
 
+// Many erase_attribute() patterns are really just a literal name, or a
+// literal with a leading and/or trailing ".*" (like "GPS:.*"). Recognize
+// those so they can be matched with plain string comparisons instead of
+// std::regex. Return false if the pattern needs a real regex.
+static bool
+simple_name_pattern(string_view pattern, string_view& literal,
+                    bool& anyprefix, bool& anysuffix)
+{
+    anyprefix = Strutil::starts_with(pattern, ".*");
+    if (anyprefix)
+        pattern.remove_prefix(2);
+    anysuffix = Strutil::ends_with(pattern, ".*");
+    if (anysuffix)
+        pattern.remove_suffix(2);
+    // Anything that is special in a POSIX basic regex disqualifies it
+    if (Strutil::contains_any_char(pattern, ".[]\\*^$"))
+        return false;
+    literal = pattern;
+    return true;
+}
+
+
+
 void
 ImageSpec::erase_attribute(string_view name, TypeDesc searchtype,
                            bool casesensitive)
 {
     if (extra_attribs.empty())
         return;  // Don't mess with regexp if there isn't any metadata
+    if (name == ".*" && searchtype == TypeUnknown) {
+        // Matches every name, no need to compile or run the regex
+        extra_attribs.clear();
+        return;
+    }
+    auto erase_matching = [&](auto namematch) {
+        auto matcher = [&](const ParamValue& p) {
+            return (searchtype == TypeUnknown || searchtype == p.type())
+                   && namematch(p.name().string());
+        };
+        auto del = std::remove_if(extra_attribs.begin(), extra_attribs.end(),
+                                  matcher);
+        extra_attribs.erase(del, extra_attribs.end());
+    };
+    string_view literal;
+    bool anyprefix, anysuffix;
+    if (simple_name_pattern(name, literal, anyprefix, anysuffix)) {
+        erase_matching([&](string_view n) {
+            if (anyprefix && anysuffix)
+                return casesensitive ? Strutil::contains(n, literal)
+                                     : Strutil::icontains(n, literal);
+            if (anyprefix)
+                return casesensitive ? Strutil::ends_with(n, literal)
+                                     : Strutil::iends_with(n, literal);
+            if (anysuffix)
+                return casesensitive ? Strutil::starts_with(n, literal)
+                                     : Strutil::istarts_with(n, literal);
+            return casesensitive ? n == literal : Strutil::iequals(n, literal);
+        });
+        return;
+    }
     try {
         std::regex_constants::syntax_option_type flag
             = std::regex_constants::basic;
         if (!casesensitive)
             flag |= std::regex_constants::icase;
-        std::regex re(std::string(name), flag);
-        auto matcher = [&](const ParamValue& p) {
-            return std::regex_match(p.name().string(), re)
-                   && (searchtype == TypeUnknown || searchtype == p.type());
+        // The same pattern tends to be applied over and over (every
+        // subimage, every file), so hang on to the last one we compiled.
+        struct CachedRegex {
+            std::string pattern;
+            std::regex_constants::syntax_option_type flag;
+            std::regex re;
         };
-        auto del = std::remove_if(extra_attribs.begin(), extra_attribs.end(),
-                                  matcher);
-        extra_attribs.erase(del, extra_attribs.end());
+        static thread_local std::unique_ptr<CachedRegex> cache;
+        if (!cache || cache->flag != flag
+            || string_view(cache->pattern) != name) {
+            std::regex re(std::string(name), flag);  // may throw
+            cache.reset(new CachedRegex { std::string(name), flag,
+                                          std::move(re) });
+        }
+        const std::regex& re(cache->re);
+        erase_matching([&](const std::string& n) {
+            return std::regex_match(n, re);
+        });
     } catch (...) {
         return;
     }
@@ -343,20 +343,37 @@ circular_shift_(ImageBuf& dst, const ImageBuf& src, int xshift, int yshift,
     ImageBufAlgo::parallel_image(roi, nthreads, [&](ROI roi) {
         int width = dstroi.width(), height = dstroi.height(),
             depth = dstroi.depth();
-        ImageBuf::ConstIterator<SRCTYPE, DSTTYPE> s(src, roi);
-        ImageBuf::Iterator<DSTTYPE, DSTTYPE> d(dst);
-        for (; !s.done(); ++s) {
-            int dx = s.x() + xshift;
-            OIIO::wrap_periodic(dx, dstroi.xbegin, width);
-            int dy = s.y() + yshift;
-            OIIO::wrap_periodic(dy, dstroi.ybegin, height);
-            int dz = s.z() + zshift;
+        // Each source scanline lands in the destination as at most two
+        // runs of pixels, split where x wraps around. Copy run by run
+        // rather than repositioning the destination for every pixel.
+        int xs = xshift;
+        OIIO::wrap_periodic(xs, 0, width);
+        int xsplit = dstroi.xend - xs;  // first source x that wraps
+        struct Run {
+            int xbegin, xend, xoffset;
+        };
+        Run runs[2] = { { roi.xbegin, std::min(roi.xend, xsplit), xs },
+                        { std::max(roi.xbegin, xsplit), roi.xend,
+                          xs - width } };
+        for (int z = roi.zbegin; z < roi.zend; ++z) {
+            int dz = z + zshift;
             OIIO::wrap_periodic(dz, dstroi.zbegin, depth);
-            d.pos(dx, dy, dz);
-            if (!d.exists())
-                continue;
-            for (int c = roi.chbegin; c < roi.chend; ++c)
-                d[c] = s[c];
+            for (int y = roi.ybegin; y < roi.yend; ++y) {
+                int dy = y + yshift;
+                OIIO::wrap_periodic(dy, dstroi.ybegin, height);
+                for (const Run& run : runs) {
+                    if (run.xbegin >= run.xend)
+                        continue;
+                    ImageBuf::ConstIterator<SRCTYPE, DSTTYPE> s(
+                        src, run.xbegin, run.xend, y, y + 1, z, z + 1);
+                    ImageBuf::Iterator<DSTTYPE, DSTTYPE> d(
+                        dst, run.xbegin + run.xoffset, run.xend + run.xoffset,
+                        dy, dy + 1, dz, dz + 1);
+                    for (; !s.done(); ++s, ++d)
+                        for (int c = roi.chbegin; c < roi.chend; ++c)
+                            d[c] = s[c];
+                }
+            }
         }
     });
     return true;
@@ -188,9 +188,11 @@ ImageBufAlgo::zero(ImageBuf& dst, ROI roi, int nthreads)
     if (!IBAprep(roi, &dst))
         return false;
     OIIO_ASSERT(dst.localpixels());
-    if (dst.contiguous() && roi == dst.roi() && !dst.deep()) {
-        // Special case: we're zeroing out an entire contiguous buffer -- safe
-        // to use use memset.
+    if (dst.contiguous() && !dst.deep() && roi.chbegin == 0
+        && roi.chend == dst.nchannels()) {
+        // Special case: we're zeroing all channels of a region of a
+        // contiguous buffer, so each scanline of the region is one
+        // contiguous span of bytes -- safe to use memset.
         ImageBufAlgo::parallel_image(roi, nthreads, [=, &dst](ROI roi) {
             auto size = dst.spec().pixel_bytes() * imagesize_t(roi.width());
             for (int z = roi.zbegin; z < roi.zend; ++z) {
@@ -398,23 +400,22 @@ static bool
 render_box_(ImageBuf& dst, cspan<float> color, ROI roi = ROI(),
             int nthreads = 1)
 {
+    float alpha = 1.0f;
+    if (dst.spec().alpha_channel >= 0
+        && dst.spec().alpha_channel < int(color.size()))
+        alpha = color[dst.spec().alpha_channel];
+    else if (int(color.size()) == roi.chend + 1)
+        alpha = color[roi.chend];
+
+    // An opaque box is just a constant fill, which converts the color to
+    // the buffer's type once rather than for every pixel.
+    if (alpha == 1.0f)
+        return fill_const_<T>(dst, color.data(), roi, nthreads);
+
     ImageBufAlgo::parallel_image(roi, nthreads, [&](ROI roi) {
-        float alpha = 1.0f;
-        if (dst.spec().alpha_channel >= 0
-            && dst.spec().alpha_channel < int(color.size()))
-            alpha = color[dst.spec().alpha_channel];
-        else if (int(color.size()) == roi.chend + 1)
-            alpha = color[roi.chend];
-
-        if (alpha == 1.0f) {
-            for (ImageBuf::Iterator<T> r(dst, roi); !r.done(); ++r)
-                for (int c = roi.chbegin; c < roi.chend; ++c)
-                    r[c] = color[c];
-        } else {
-            for (ImageBuf::Iterator<T> r(dst, roi); !r.done(); ++r)
-                for (int c = roi.chbegin; c < roi.chend; ++c)
-                    r[c] = color[c] + r[c] * (1.0f - alpha);  // "over"
-        }
+        for (ImageBuf::Iterator<T> r(dst, roi); !r.done(); ++r)
+            for (int c = roi.chbegin; c < roi.chend; ++c)
+                r[c] = color[c] + r[c] * (1.0f - alpha);  // "over"
     });
     return true;
 }
@@ -478,20 +479,25 @@ checker_(ImageBuf& dst, Dim3 size, const float* color1, const float* color2,
          Dim3 offset, ROI roi, int nthreads = 1)
 {
     ImageBufAlgo::parallel_image(roi, nthreads, [&](ROI roi) {
-        for (ImageBuf::Iterator<T> p(dst, roi); !p.done(); ++p) {
+        // Do the data conversion just once, store locally.
+        T* tcolor1 = OIIO_ALLOCA(T, roi.chend);
+        T* tcolor2 = OIIO_ALLOCA(T, roi.chend);
+        for (int c = roi.chbegin; c < roi.chend; ++c) {
+            tcolor1[c] = convert_type<float, T>(color1[c]);
+            tcolor2[c] = convert_type<float, T>(color2[c]);
+        }
+        int nchannels = roi.nchannels();
+        for (ImageBuf::Iterator<T, T> p(dst, roi); !p.done(); ++p) {
             int xtile = (p.x() - offset.x) / size.x;
             xtile += (p.x() < offset.x);
             int ytile = (p.y() - offset.y) / size.y;
             ytile += (p.y() < offset.y);
             int ztile = (p.z() - offset.z) / size.z;
             ztile += (p.z() < offset.z);
-            int v = xtile + ytile + ztile;
-            if (v & 1)
-                for (int c = roi.chbegin; c < roi.chend; ++c)
-                    p[c] = color2[c];
-            else
-                for (int c = roi.chbegin; c < roi.chend; ++c)
-                    p[c] = color1[c];
+            int v          = xtile + ytile + ztile;
+            const T* color = (v & 1) ? tcolor2 : tcolor1;
+            memcpy((T*)p.rawptr() + roi.chbegin, color + roi.chbegin,
+                   nchannels * sizeof(T));
         }
     });
     return true;
@@ -1026,6 +1032,30 @@ ImageBufAlgo::text_size(string_view text, int fontsize, string_view font_)
 
 
 
+#ifdef USE_FREETYPE
+// Composite textcolor, with coverage from textimg and alpha from alphaimg
+// (both single channel float), "over" the pixels of R within roi.
+template<typename T>
+static bool
+render_text_over_(ImageBuf& R, const ImageBuf& textimg,
+                  const ImageBuf& alphaimg, const float* textcolor,
+                  float textalpha, ROI roi)
+{
+    int nchannels = R.nchannels();
+    ImageBuf::ConstIterator<float> t(textimg, roi, ImageBuf::WrapBlack);
+    ImageBuf::ConstIterator<float> a(alphaimg, roi, ImageBuf::WrapBlack);
+    for (ImageBuf::Iterator<T> r(R, roi); !r.done(); ++r, ++t, ++a) {
+        float val   = t[0];
+        float alpha = a[0] * textalpha;
+        for (int c = 0; c < nchannels; ++c)
+            r[c] = val * textcolor[c] + (1.0f - alpha) * r[c];
+    }
+    return true;
+}
+#endif
+
+
+
 bool
 ImageBufAlgo::render_text(ImageBuf& R, int x, int y, string_view text,
                           int fontsize, string_view font_,
@@ -1144,12 +1174,11 @@ ImageBufAlgo::render_text(ImageBuf& R, int x, int y, string_view text,
     }
 
     // Generate the alpha image -- if drop shadow is requested, dilate,
-    // otherwise it's just a copy of the text image
-    ImageBuf alphaimg;
+    // otherwise it's just the text image itself
+    ImageBuf shadowimg;
     if (shadow)
-        dilate(alphaimg, textimg, 2 * shadow + 1);
-    else
-        alphaimg.copy(textimg);
+        dilate(shadowimg, textimg, 2 * shadow + 1);
+    const ImageBuf& alphaimg(shadow ? shadowimg : textimg);
 
     if (!roi.defined())
         roi = textroi;
@@ -1158,21 +1187,12 @@ ImageBufAlgo::render_text(ImageBuf& R, int x, int y, string_view text,
     roi = roi_intersection(textroi, R.roi());
 
     // Now fill in the pixels of our destination image
-    float* pixelcolor = OIIO_ALLOCA(float, nchannels);
-    ImageBuf::ConstIterator<float> t(textimg, roi, ImageBuf::WrapBlack);
-    ImageBuf::ConstIterator<float> a(alphaimg, roi, ImageBuf::WrapBlack);
-    ImageBuf::Iterator<float> r(R, roi);
-    for (; !r.done(); ++r, ++t, ++a) {
-        float val   = t[0];
-        float alpha = a[0] * textalpha;
-        R.getpixel(r.x(), r.y(), pixelcolor);
-        for (int c = 0; c < nchannels; ++c)
-            pixelcolor[c] = val * textcolor[c] + (1.0f - alpha) * pixelcolor[c];
-        R.setpixel(r.x(), r.y(), pixelcolor);
-    }
+    OIIO_DISPATCH_TYPES(ok, "render_text", render_text_over_, R.spec().format,
+                        R, textimg, alphaimg, textcolor.data(), textalpha,
+                        roi);
 
     FT_Done_Face(face);
-    return true;
+    return ok;
 
 #else
     R.errorfmt("OpenImageIO was not compiled with FreeType for font rendering");
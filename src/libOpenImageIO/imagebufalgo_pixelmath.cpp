@@ -1011,55 +1011,61 @@ contrast_remap_(ImageBuf& dst, const ImageBuf& src, cspan<float> black,
     bool use_sigmoid = !allspan(scontrast, 1.0f);
     bool do_minmax   = !(allspan(min, 0.0f) && allspan(max, 1.0f));
 
-    ImageBufAlgo::parallel_image(roi, nthreads, [&](ROI roi) {
+    // The sigmoid's offset and scale only depend on the channel.
+    // See http://www.imagemagick.org/Usage/color_mods/#sigmoidal
+    // for a description of the shaping function.
+    float* y     = OIIO_ALLOCA(float, roi.chend);
+    float* denom = OIIO_ALLOCA(float, roi.chend);
+    if (use_sigmoid) {
+        for (int c = roi.chbegin; c < roi.chend; ++c) {
+            y[c]     = 1.0f / (1.0f + expf(scontrast[c] * sthresh[c]));
+            denom[c] = 1.0f / (1.0f + expf(scontrast[c] * (sthresh[c] - 1.0f)))
+                       - y[c];
+        }
+    }
+
+    auto remap = [&](float val, int c) -> float {
         if (same_black_white) {
             // Special case -- black & white are the same value, which is
             // just a binary threshold.
-            ImageBuf::ConstIterator<S> s(src, roi);
+            return val < black[c] ? min[c] : max[c];
+        }
+        // First do the linear stretch
+        float r = (val - black[c]) * bwdiffinv[c];
+        // Apply the sigmoid if needed
+        if (use_sigmoid) {
+            float x = 1.0f / (1.0f + expf(scontrast[c] * (sthresh[c] - r)));
+            r       = (x - y[c]) / denom[c];
+        }
+        // remap output range if needed
+        if (do_minmax)
+            r = lerp(min[c], max[c], r);
+        return r;
+    };
+
+    if (std::is_same<S, unsigned char>::value) {
+        // An 8 bit source channel can only hold 256 different values, so
+        // remap each of those once, then just look up every pixel.
+        std::vector<float> lut(size_t(roi.chend) * 256);
+        for (int c = roi.chbegin; c < roi.chend; ++c)
+            for (int v = 0; v < 256; ++v)
+                lut[c * 256 + v]
+                    = remap(convert_type<unsigned char, float>(v), c);
+        ImageBufAlgo::parallel_image(roi, nthreads, [&](ROI roi) {
+            ImageBuf::ConstIterator<S, S> s(src, roi);
             for (ImageBuf::Iterator<D> d(dst, roi); !d.done(); ++d, ++s) {
                 for (int c = roi.chbegin; c < roi.chend; ++c)
-                    d[c] = (s[c] < black[c] ? min[c] : max[c]);
+                    d[c] = lut[c * 256 + int(S(s[c]))];
             }
-            return;
-        }
+        });
+        return true;
+    }
 
-        // First do the linear stretch
-        float* r = OIIO_ALLOCA(float, roi.chend);  // temp result
+    ImageBufAlgo::parallel_image(roi, nthreads, [&](ROI roi) {
         ImageBuf::ConstIterator<S> s(src, roi);
-        float* y     = OIIO_ALLOCA(float, roi.chend);
-        float* denom = OIIO_ALLOCA(float, roi.chend);
         for (ImageBuf::Iterator<D> d(dst, roi); !d.done(); ++d, ++s) {
             for (int c = roi.chbegin; c < roi.chend; ++c)
-                r[c] = (s[c] - black[c]) * bwdiffinv[c];
-
-            // Apply the sigmoid if needed
-            // See http://www.imagemagick.org/Usage/color_mods/#sigmoidal
-            // for a description of the shaping function.
-            if (use_sigmoid) {
-                // Sorry about the lack of clarity, we're working hard to
-                // minimize computation.
-                for (int c = roi.chbegin; c < roi.chend; ++c) {
-                    y[c]     = 1.0f / (1.0f + expf(scontrast[c] * sthresh[c]));
-                    denom[c] = 1.0f
-                                   / (1.0f
-                                      + expf(scontrast[c] * (sthresh[c] - 1.0f)))
-                               - y[c];
-                }
-                for (int c = roi.chbegin; c < roi.chend; ++c) {
-                    float x = 1.0f
-                              / (1.0f
-                                 + expf(scontrast[c] * (sthresh[c] - r[c])));
-                    r[c] = (x - y[c]) / denom[c];
-                }
-            }
-
-            // remap output range if needed
-            if (do_minmax) {
-                for (int c = roi.chbegin; c < roi.chend; ++c)
-                    r[c] = lerp(min[c], max[c], r[c]);
-            }
-            for (int c = roi.chbegin; c < roi.chend; ++c)
-                d[c] = r[c];
+                d[c] = remap(s[c], c);
         }
     });
     return true;
@@ -1210,14 +1216,20 @@ color_map_(ImageBuf& dst, const ImageBuf& src, int srcchannel, int nknots,
         roi.chend = std::min(roi.chend, channels);
         ImageBuf::Iterator<D> d(dst, roi);
         ImageBuf::ConstIterator<S> s(src, roi);
+        const int nsegs = nknots - 1;
         for (; !d.done(); ++d, ++s) {
             float x = srcchannel < 0
                           ? 0.2126f * s[0] + 0.7152f * s[1] + 0.0722f * s[2]
                           : s[srcchannel];
-            for (int c = roi.chbegin; c < roi.chend; ++c) {
-                span_strided<const float> k(knots.data() + c, nknots, channels);
-                d[c] = interpolate_linear(x, k);
-            }
+            // Same as interpolate_linear() on each channel's knots, but
+            // only find the segment once for all the channels.
+            int segnum;
+            x = floorfrac(clamp(x, 0.0f, 1.0f) * nsegs, &segnum);
+            const float* k0 = knots.data() + segnum * channels;
+            const float* k1 = knots.data()
+                              + std::min(segnum + 1, nsegs) * channels;
+            for (int c = roi.chbegin; c < roi.chend; ++c)
+                d[c] = lerp(k0[c], k1[c], x);
         }
     });
     return true;
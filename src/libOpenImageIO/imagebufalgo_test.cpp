@@ -193,6 +193,28 @@ test_zero_fill()
         }
     }
 
+    // Test zero of partial image
+    {
+        const int xbegin = 2, xend = 6, ybegin = 1, yend = 3;
+        ImageBufAlgo::zero(A, ROI(xbegin, xend, ybegin, yend));
+        for (int j = 0; j < HEIGHT; ++j) {
+            for (int i = 0; i < WIDTH; ++i) {
+                float pixel[CHANNELS];
+                A.getpixel(i, j, pixel);
+                if (j >= ybegin && j < yend && i >= xbegin && i < xend) {
+                    for (int c = 0; c < CHANNELS; ++c)
+                        OIIO_CHECK_EQUAL(pixel[c], 0.0f);
+                } else if (j >= 0 && j < 4 && i >= 3 && i < 5) {
+                    for (int c = 0; c < CHANNELS; ++c)
+                        OIIO_CHECK_EQUAL(pixel[c], arbitrary3[c]);
+                } else {
+                    for (int c = 0; c < CHANNELS; ++c)
+                        OIIO_CHECK_EQUAL(pixel[c], arbitrary2[c]);
+                }
+            }
+        }
+    }
+
     // Timing
     Benchmarker bench;
     ImageBuf buf_rgba_float(ImageSpec(1000, 1000, 4, TypeFloat));
@@ -559,6 +581,35 @@ test_max()
 
 
 
+// Tests ImageBufAlgo::contrast_remap, making sure that 8 bit sources
+// (which use a lookup table) get the same results as float sources.
+void
+test_contrast_remap()
+{
+    std::cout << "test contrast_remap\n";
+
+    // A ramp through all 256 values of an 8 bit channel, and the same
+    // values in a float image.
+    ImageBuf A(ImageSpec(256, 1, 2, TypeUInt8));
+    for (ImageBuf::Iterator<unsigned char, unsigned char> a(A); !a.done(); ++a)
+        a[0] = a[1] = (unsigned char)a.x();
+    ImageBuf F = A.copy(TypeFloat);
+
+    const float black[]     = { 0.1f, 0.25f };
+    const float white[]     = { 0.75f, 0.5f };
+    const float scontrast[] = { 5.0f, 1.0f };
+    ImageBuf R, Rf;
+    ImageBufAlgo::contrast_remap(R, A, black, white, 0.0f, 1.0f, scontrast);
+    ImageBufAlgo::contrast_remap(Rf, F, black, white, 0.0f, 1.0f, scontrast);
+    OIIO_CHECK_EQUAL(R.spec().format, TypeUInt8);
+    OIIO_CHECK_EQUAL(Rf.spec().format, TypeFloat);
+    ImageBuf Rq = Rf.copy(TypeUInt8);
+    auto comp   = ImageBufAlgo::compare(R, Rq, 0.0f, 0.0f);
+    OIIO_CHECK_EQUAL(comp.maxerror, 0.0f);
+}
+
+
+
 // Test ImageBuf::over
 void
 test_over(TypeDesc dtype = TypeFloat)
@@ -1135,6 +1186,62 @@ test_opencv()
 
 
 
+// Tests ImageBufAlgo::colormatrixtransform, and the matrix
+// ColorProcessor on data with fewer than 3 channels.
+void
+test_colormatrixtransform()
+{
+    std::cout << "test colormatrixtransform\n";
+    const float M[4][4] = { { 0.5f, 0.25f, 0.0f, 0.0f },
+                            { 2.0f, -1.0f, 0.0f, 0.0f },
+                            { 0.0f, 0.0f, 1.0f, 0.0f },
+                            { 0.0f, 0.0f, 0.0f, 1.0f } };
+    // Row vector times matrix, for a 2-channel color (the missing
+    // channels are zero).
+    auto xform = [&](float r, float g, int c) {
+        return r * M[0][c] + g * M[1][c];
+    };
+
+    // 2-channel float image, every pixel different
+    const int w = 4, h = 3;
+    ImageBuf A(ImageSpec(w, h, 2, TypeFloat));
+    for (ImageBuf::Iterator<float> a(A); !a.done(); ++a) {
+        a[0] = 0.1f * (a.x() + 1);
+        a[1] = 0.01f * (a.y() + 1);
+    }
+    ImageBuf R = ImageBufAlgo::colormatrixtransform(A, M);
+    OIIO_CHECK_ASSERT(!R.has_error());
+    OIIO_CHECK_EQUAL(R.nchannels(), 2);
+    ImageBuf::ConstIterator<float> a(A);
+    for (ImageBuf::ConstIterator<float> r(R); !r.done(); ++r, ++a)
+        for (int c = 0; c < 2; ++c)
+            OIIO_CHECK_EQUAL_THRESH(r[c], xform(a[0], a[1], c), 1e-6f);
+
+    // Apply the processor directly to interleaved 2-channel pixels, which
+    // takes its general path. Each pixel must be transformed in place, and
+    // nothing past the last pixel may be touched.
+    ColorProcessorHandle proc = ColorConfig::default_colorconfig()
+                                    .createMatrixTransform(M);
+    OIIO_CHECK_ASSERT(proc);
+    float data[2 * w + 2];
+    for (int i = 0; i < 2 * w; ++i)
+        data[i] = 0.1f * (i + 1);
+    data[2 * w] = data[2 * w + 1] = 42.0f;  // guard values
+    float orig[2 * w];
+    std::copy(data, data + 2 * w, orig);
+    proc->apply(data, w, 1, 2, sizeof(float), 2 * sizeof(float),
+                2 * w * sizeof(float));
+    for (int x = 0; x < w; ++x)
+        for (int c = 0; c < 2; ++c)
+            OIIO_CHECK_EQUAL_THRESH(data[2 * x + c],
+                                    xform(orig[2 * x], orig[2 * x + 1], c),
+                                    1e-6f);
+    OIIO_CHECK_EQUAL(data[2 * w], 42.0f);
+    OIIO_CHECK_EQUAL(data[2 * w + 1], 42.0f);
+}
+
+
+
 void
 test_color_management()
 {
@@ -1212,6 +1319,7 @@ main(int argc, char** argv)
     test_mad();
     test_min();
     test_max();
+    test_contrast_remap();
     test_over(TypeFloat);
     test_over(TypeHalf);
     test_zover();
@@ -1225,6 +1333,7 @@ main(int argc, char** argv)
     test_IBAprep();
     test_validate_st_warp_checks();
     test_opencv();
+    test_colormatrixtransform();
     test_color_management();
     test_yee();
 
@@ -292,6 +292,55 @@ test_get_attribute()
 }
 
 
+static void
+test_erase_attribute()
+{
+    std::cout << "test_erase_attribute\n";
+    ImageSpec spec(64, 64, 3, TypeDesc::FLOAT);
+    spec.attribute("Make", "Canon");
+    spec.attribute("GPS:Latitude", 37.0f);
+    spec.attribute("GPS:Longitude", -122.0f);
+    spec.attribute("foo", 42);
+
+    spec.erase_attribute("GPS:.*", TypeFloat);
+    OIIO_CHECK_EQUAL(spec.extra_attribs.size(), 2);
+    OIIO_CHECK_ASSERT(spec.find_attribute("GPS:Latitude") == nullptr);
+
+    // Match-all pattern restricted to a type only erases that type
+    spec.erase_attribute(".*", TypeInt);
+    OIIO_CHECK_EQUAL(spec.extra_attribs.size(), 1);
+    OIIO_CHECK_ASSERT(spec.find_attribute("Make") != nullptr);
+
+    // Unrestricted match-all pattern erases everything
+    spec.erase_attribute(".*");
+    OIIO_CHECK_ASSERT(spec.extra_attribs.empty());
+
+    // Literal names, and literals with leading/trailing wildcards, bypass
+    // the regex engine but must behave exactly as the regex would.
+    spec.attribute("Make", "Canon");
+    spec.attribute("Model", "EOS");
+    spec.attribute("Exif:ExposureTime", 0.01f);
+    spec.attribute("Exif:FNumber", 2.8f);
+    spec.attribute("tiff:XResolution", 72.0f);
+    spec.attribute("Software", "oiio");
+    spec.erase_attribute("make", TypeUnknown, true);
+    OIIO_CHECK_ASSERT(spec.find_attribute("Make") != nullptr);
+    spec.erase_attribute("make", TypeUnknown, false);
+    OIIO_CHECK_ASSERT(spec.find_attribute("Make") == nullptr);
+    spec.erase_attribute(".*Resolution");
+    OIIO_CHECK_ASSERT(spec.find_attribute("tiff:XResolution") == nullptr);
+    spec.erase_attribute(".*Exposure.*");
+    OIIO_CHECK_ASSERT(spec.find_attribute("Exif:ExposureTime") == nullptr);
+    OIIO_CHECK_ASSERT(spec.find_attribute("Exif:FNumber") != nullptr);
+    spec.erase_attribute("Mod.l");
+    OIIO_CHECK_ASSERT(spec.find_attribute("Model") == nullptr);
+    spec.erase_attribute("Exif:.*", TypeUnknown, false);
+    OIIO_CHECK_EQUAL(spec.extra_attribs.size(), 1);
+    OIIO_CHECK_ASSERT(spec.find_attribute("Software") != nullptr);
+}
+
+
+
 static void
 test_imagespec_from_ROI()
 {
@@ -335,6 +384,7 @@ main(int /*argc*/, char* /*argv*/[])
     test_imagespec_metadata_val();
     test_imagespec_attribute_from_string();
     test_get_attribute();
+    test_erase_attribute();
     test_imagespec_from_ROI();
     test_imagespec_from_xml();
 
@@ -284,13 +284,61 @@ brief_format_name(TypeDesc type, int bits = 0)
 
 
 
+// Case-insensitive search for a --metamatch or --no-metamatch expression
+// within metadata field names. The expression is usually just a list of
+// plain words separated by '|' (the testsuite uses
+// "DateTime|Software|OriginatingProgram|ImageHistory"), in which case it
+// is done with substring searches rather than std::regex.
+class FieldMatcher {
+public:
+    // Set the expression, returning false and setting `error` if it's not
+    // a valid extended regex.
+    bool assign(const std::string& pattern, std::string& error)
+    {
+        m_literal = !Strutil::contains_any_char(pattern, ".[](){}*+?^$\\");
+        if (m_literal) {
+            m_words = Strutil::splits(pattern, "|");
+            return true;
+        }
+        try {
+            m_re.assign(pattern, std::regex_constants::extended
+                                     | std::regex_constants::icase);
+        } catch (const std::exception& e) {
+            error = Strutil::fmt::format(
+                "Regex error '{}' on metamatch regex \"{}\"", e.what(),
+                pattern);
+            return false;
+        }
+        return true;
+    }
+
+    // Does the expression match anywhere within `s`?
+    bool search(const std::string& s) const
+    {
+        if (!m_literal)
+            return std::regex_search(s, m_re);
+        for (auto& w : m_words)
+            if (w.empty() || Strutil::icontains(s, w))
+                return true;
+        return false;
+    }
+
+private:
+    std::regex m_re;
+    std::vector<std::string> m_words;
+    bool m_literal = false;
+};
+
+
+
 static void
 print_info_subimage(std::ostream& out, Oiiotool& ot, int current_subimage,
                     int num_of_subimages, int nmip, const ImageSpec& spec,
                     ImageRec* img, ImageInput* input,
                     const std::string& filename,
-                    const pvt::print_info_options& opt, std::regex& field_re,
-                    std::regex& field_exclude_re,
+                    const pvt::print_info_options& opt,
+                    const FieldMatcher& field_re,
+                    const FieldMatcher& field_exclude_re,
                     ImageSpec::SerialFormat serformat,
                     ImageSpec::SerialVerbose verbose)
 {
@@ -301,14 +349,13 @@ print_info_subimage(std::ostream& out, Oiiotool& ot, int current_subimage,
     bool printres
         = opt.verbose
           && (opt.metamatch.empty()
-              || std::regex_search("resolution, width, height, depth, channels",
-                                   field_re));
+              || field_re.search("resolution, width, height, depth, channels"));
 
     std::vector<std::string> lines;
     Strutil::split(spec.serialize(serformat, verbose), lines, "\n");
 
     if (input && opt.compute_sha1
-        && (opt.metamatch.empty() || std::regex_search("sha-1", field_re))) {
+        && (opt.metamatch.empty() || field_re.search("sha-1"))) {
         // Before sha-1, be sure to point back to the highest-res MIP level
         ImageSpec tmpspec;
         std::string err;
@@ -342,8 +389,7 @@ print_info_subimage(std::ostream& out, Oiiotool& ot, int current_subimage,
     if (serformat == ImageSpec::SerialText) {
         // Requested a subset of metadata but not res, etc.? Kill first line.
         if (opt.metamatch.empty()
-            || std::regex_search("resolution, width, height, depth, channels",
-                                 field_re)) {
+            || field_re.search("resolution, width, height, depth, channels")) {
             std::string orig_line0 = lines[0];
             if (current_subimage == 0) {
                 if (filename.size())
@@ -424,9 +470,8 @@ print_info_subimage(std::ostream& out, Oiiotool& ot, int current_subimage,
                 continue;
             }
             std::string s = lines[i].substr(0, lines[i].find(": "));
-            if ((!opt.nometamatch.empty()
-                 && std::regex_search(s, field_exclude_re))
-                || (!opt.metamatch.empty() && !std::regex_search(s, field_re))) {
+            if ((!opt.nometamatch.empty() && field_exclude_re.search(s))
+                || (!opt.metamatch.empty() && !field_re.search(s))) {
                 lines.erase(lines.begin() + i);
                 --i;
             }
@@ -452,7 +497,7 @@ print_info_subimage(std::ostream& out, Oiiotool& ot, int current_subimage,
     }
 
     if (opt.compute_stats
-        && (opt.metamatch.empty() || std::regex_search("stats", field_re))) {
+        && (opt.metamatch.empty() || field_re.search("stats"))) {
         for (int m = 0; m < nmip; ++m) {
             ImageSpec mipspec;
             if (input)
@@ -504,29 +549,13 @@ OiioTool::print_info(std::ostream& out, Oiiotool& ot, ImageRec* img,
                                            ? ImageSpec::SerialDetailedHuman
                                            : ImageSpec::SerialBrief;
 
-    std::regex field_re;
-    std::regex field_exclude_re;
-    if (!opt.metamatch.empty()) {
-        try {
-            field_re.assign(opt.metamatch, std::regex_constants::extended
-                                               | std::regex_constants::icase);
-        } catch (const std::exception& e) {
-            error = format("Regex error '{}' on metamatch regex \"{}\"",
-                           e.what(), opt.metamatch);
-            return false;
-        }
-    }
-    if (!opt.nometamatch.empty()) {
-        try {
-            field_exclude_re.assign(opt.nometamatch,
-                                    std::regex_constants::extended
-                                        | std::regex_constants::icase);
-        } catch (const std::exception& e) {
-            error = format("Regex error '{}' on metamatch regex \"{}\"",
-                           e.what(), opt.nometamatch);
-            return false;
-        }
-    }
+    FieldMatcher field_re;
+    FieldMatcher field_exclude_re;
+    if (!opt.metamatch.empty() && !field_re.assign(opt.metamatch, error))
+        return false;
+    if (!opt.nometamatch.empty()
+        && !field_exclude_re.assign(opt.nometamatch, error))
+        return false;
 
     for (int s = 0, nsubimages = img->subimages(); s < nsubimages; ++s) {
         const ImageSpec* spec = opt.native ? img->nativespec(s) : img->spec(s);
@@ -567,29 +596,13 @@ OiioTool::print_info(std::ostream& out, Oiiotool& ot,
                                            ? ImageSpec::SerialDetailedHuman
                                            : ImageSpec::SerialBrief;
 
-    std::regex field_re;
-    std::regex field_exclude_re;
-    if (!opt.metamatch.empty()) {
-        try {
-            field_re.assign(opt.metamatch, std::regex_constants::extended
-                                               | std::regex_constants::icase);
-        } catch (const std::exception& e) {
-            error = format("Regex error '{}' on metamatch regex \"{}\"",
-                           e.what(), opt.metamatch);
-            return false;
-        }
-    }
-    if (!opt.nometamatch.empty()) {
-        try {
-            field_exclude_re.assign(opt.nometamatch,
-                                    std::regex_constants::extended
-                                        | std::regex_constants::icase);
-        } catch (const std::exception& e) {
-            error = format("Regex error '{}' on metamatch regex \"{}\"",
-                           e.what(), opt.nometamatch);
-            return false;
-        }
-    }
+    FieldMatcher field_re;
+    FieldMatcher field_exclude_re;
+    if (!opt.metamatch.empty() && !field_re.assign(opt.metamatch, error))
+        return false;
+    if (!opt.nometamatch.empty()
+        && !field_exclude_re.assign(opt.nometamatch, error))
+        return false;
 
     // checking how many subimages and mipmap levels are stored in the file
     std::vector<int> num_of_miplevels;
@@ -7,55 +7,81 @@ LD_LIBRARY_PATH=/net/soft_scratch/users/jeremys/git/ocio.js/build/src/core/
 """
 
 import math, os, sys
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from math import exp as _exp, pow as _pow
 import PyOpenColorIO as OCIO
 
-print "OCIO",OCIO.version
+# NumPy is optional. Without it, the LUTs are sampled with the (much
+# slower, but equivalent) scalar transfer functions.
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 outputfilename = "config.ocio"
 
-def WriteSPI1D(filename, fromMin, fromMax, data):
-    f = file(filename,'w')
-    f.write("Version 1\n")
-    f.write("From %s %s\n" % (fromMin, fromMax))
-    f.write("Length %d\n" % len(data))
-    f.write("Components 1\n")
-    f.write("{\n")
-    for value in data:
-        f.write("        %s\n" % value)
-    f.write("}\n")
-    f.close()
+# Format a float the way Python 2's str() did (12 significant digits), so
+# that regenerating the LUTs doesn't rewrite every sample of the committed
+# files with Python 3's longer round-trip repr.
+def FormatFloat(value):
+    text = '%.12g' % value
+    if not any(c in text for c in '.einf'):
+        text += '.0'
+    return text
 
+def WriteSPI1D(filename, fromMin, fromMax, data):
+    # Assemble the whole file in memory and hand it to the OS in a single
+    # write, rather than one buffered write call per sample.
+    if np is not None:
+        data = np.asarray(data, dtype=np.float64).tolist()
+    lines = ["Version 1",
+             "From %s %s" % (FormatFloat(fromMin), FormatFloat(fromMax)),
+             "Length %d" % len(data),
+             "Components 1",
+             "{"]
+    lines += ["        %s" % FormatFloat(value) for value in data]
+    lines += ["}", ""]
+    with open(filename, 'w') as f:
+        f.write("\n".join(lines))
+
+# Works on scalars as well as on NumPy arrays
 def Fit(value, fromMin, fromMax, toMin, toMax):
     if fromMin == fromMax:
         raise ValueError("fromMin == fromMax")
     return (value - fromMin) / (fromMax - fromMin) * (toMax - toMin) + toMin
 
-
-###############################################################################
-
-
-config = OCIO.Config()
-config.setSearchPath('luts')
-
-config.setRole(OCIO.Constants.ROLE_SCENE_LINEAR, "linear")
-config.setRole(OCIO.Constants.ROLE_REFERENCE, "linear")
-config.setRole(OCIO.Constants.ROLE_COLOR_TIMING, "Cineon")
-config.setRole(OCIO.Constants.ROLE_COMPOSITING_LOG, "Cineon")
-config.setRole(OCIO.Constants.ROLE_DATA,"raw")
-config.setRole(OCIO.Constants.ROLE_DEFAULT,"raw")
-config.setRole(OCIO.Constants.ROLE_COLOR_PICKING,"sRGB")
-config.setRole(OCIO.Constants.ROLE_MATTE_PAINT,"sRGB")
-config.setRole(OCIO.Constants.ROLE_TEXTURE_PAINT,"sRGB")
-
-
-###############################################################################
-
-cs = OCIO.ColorSpace(name='linear')
-cs.setDescription("Scene-linear, high dynamic range. Used for rendering and compositing.")
-cs.setBitDepth(OCIO.Constants.BIT_DEPTH_F32)
-cs.setAllocation(OCIO.Constants.ALLOCATION_LG2)
-cs.setAllocationVars([-15.0, 6.0])
-config.addColorSpace(cs)
+# Most of the LUTs below are sampled over the same domain, so only build
+# each distinct (NUM_SAMPLES, RANGE) sample array once.
+_domain_cache = {}
+
+def domain(numSamples, valueRange):
+    key = (numSamples, tuple(valueRange))
+    xs = _domain_cache.get(key)
+    if xs is None:
+        if np is not None:
+            xs = Fit(np.linspace(0.0, 1.0, numSamples), 0.0, 1.0,
+                     valueRange[0], valueRange[1])
+            xs.setflags(write=False)
+        else:
+            xs = tuple(Fit(i/(numSamples-1.0), 0.0, 1.0,
+                           valueRange[0], valueRange[1])
+                       for i in range(numSamples))
+        _domain_cache[key] = xs
+    return xs
+
+# Evaluate a transfer function over the domain, using the array version
+# when NumPy is available and the scalar version otherwise.
+def Sample(func, func_vec, numSamples, valueRange):
+    xs = domain(numSamples, valueRange)
+    if np is None:
+        return [func(x) for x in xs]
+    return func_vec(xs)
+
+# The log curves below are all of the form 10**(a*x + b). Writing those as
+# exp(LN10*a*x + LN10*b), with the products folded into constants, turns
+# each sample into one multiply-add and one exp.
+LN10 = math.log(10.0)
 
 
 ###############################################################################
@@ -63,59 +89,19 @@ config.addColorSpace(cs)
 def toSRGB(v):
     if v<0.04045/12.92:
         return v*12.92
-    return 1.055 * v**(1.0/2.4) - 0.055
+    return 1.055 * _pow(v, 1.0/2.4) - 0.055
 
 def fromSRGB(v):
     if v<0.04045:
         return v/12.92
-    return ((v + .055) / 1.055) ** 2.4
+    return _pow((v + .055) / 1.055, 2.4)
 
-# These samples and range have been chosen to write out this colorspace with
-# a limited over/undershoot range, which also exactly samples the 0.0,1.0
-# crossings
-
-NUM_SAMPLES = 2**12+5
-RANGE = (-0.125, 1.125)
-data = []
-for i in xrange(NUM_SAMPLES):
-    x = i/(NUM_SAMPLES-1.0)
-    x = Fit(x, 0.0, 1.0, RANGE[0], RANGE[1])
-    data.append(fromSRGB(x))
-
-# Data is srgb->linear
-WriteSPI1D('luts/srgb.spi1d', RANGE[0], RANGE[1], data)
-
-cs = OCIO.ColorSpace(name='sRGB')
-cs.setDescription("Standard RGB Display Space")
-cs.setBitDepth(OCIO.Constants.BIT_DEPTH_F32)
-cs.setAllocation(OCIO.Constants.ALLOCATION_UNIFORM)
-cs.setAllocationVars([RANGE[0], RANGE[1]])
-
-t = OCIO.FileTransform('srgb.spi1d', interpolation=OCIO.Constants.INTERP_LINEAR)
-cs.setTransform(t, OCIO.Constants.COLORSPACE_DIR_TO_REFERENCE)
-config.addColorSpace(cs)
-
-
-NUM_SAMPLES = 2**16+25
-RANGE = (-0.125, 4.875)
-data = []
-for i in xrange(NUM_SAMPLES):
-    x = i/(NUM_SAMPLES-1.0)
-    x = Fit(x, 0.0, 1.0, RANGE[0], RANGE[1])
-    data.append(fromSRGB(x))
-
-# Data is srgb->linear
-WriteSPI1D('luts/srgbf.spi1d', RANGE[0], RANGE[1], data)
-
-cs = OCIO.ColorSpace(name='sRGBf')
-cs.setDescription("Standard RGB Display Space, but with additional range to preserve float highlights.")
-cs.setBitDepth(OCIO.Constants.BIT_DEPTH_F32)
-cs.setAllocation(OCIO.Constants.ALLOCATION_UNIFORM)
-cs.setAllocationVars([RANGE[0], RANGE[1]])
-
-t = OCIO.FileTransform('srgbf.spi1d', interpolation=OCIO.Constants.INTERP_LINEAR)
-cs.setTransform(t, OCIO.Constants.COLORSPACE_DIR_TO_REFERENCE)
-config.addColorSpace(cs)
+def fromSRGB_vec(x):
+    # Only evaluate the power curve for the samples above the linear toe
+    out = x / 12.92
+    curve = x >= 0.04045
+    out[curve] = ((x[curve] + .055) / 1.055) ** 2.4
+    return out
 
 
 ###############################################################################
@@ -123,94 +109,32 @@ config.addColorSpace(cs)
 def toRec709(v):
     if v<0.018:
         return v*4.5
-    return 1.099 * v**0.45 - 0.099
+    return 1.099 * _pow(v, 0.45) - 0.099
 
 def fromRec709(v):
     if v<0.018*4.5:
         return v/4.5
-    return ((v + .099) / 1.099) ** (1.0/0.45)
-
-# These samples and range have been chosen to write out this colorspace with
-# a limited over/undershoot range, which also exactly samples the 0.0,1.0
-# crossings
-
-NUM_SAMPLES = 2**12+5
-RANGE = (-0.125, 1.125)
-data = []
-for i in xrange(NUM_SAMPLES):
-    x = i/(NUM_SAMPLES-1.0)
-    x = Fit(x, 0.0, 1.0, RANGE[0], RANGE[1])
-    data.append(fromRec709(x))
+    return _pow((v + .099) / 1.099, 1.0/0.45)
 
-# Data is srgb->linear
-WriteSPI1D('luts/rec709.spi1d', RANGE[0], RANGE[1], data)
-
-cs = OCIO.ColorSpace(name='rec709')
-cs.setDescription("Rec. 709 (Full Range) Display Space")
-cs.setBitDepth(OCIO.Constants.BIT_DEPTH_F32)
-cs.setAllocation(OCIO.Constants.ALLOCATION_UNIFORM)
-cs.setAllocationVars([RANGE[0], RANGE[1]])
-
-t = OCIO.FileTransform('rec709.spi1d', interpolation=OCIO.Constants.INTERP_LINEAR)
-cs.setTransform(t, OCIO.Constants.COLORSPACE_DIR_TO_REFERENCE)
-config.addColorSpace(cs)
+def fromRec709_vec(x):
+    out = x / 4.5
+    curve = x >= 0.018*4.5
+    out[curve] = ((x[curve] + .099) / 1.099) ** (1.0/0.45)
+    return out
 
 
 ###############################################################################
 
 cineonBlackOffset = 10.0 ** ((95.0 - 685.0)/300.0)
 
-def fromCineon(x):
-    return (10.0**((1023.0 * x - 685.0) / 300.0) - cineonBlackOffset) / (1.0 - cineonBlackOffset)
+cineonScale = LN10 * 1023.0 / 300.0
+cineonOffset = LN10 * -685.0 / 300.0
 
-# These samples and range have been chosen to write out this colorspace with
-# a limited over/undershoot range, which also exactly samples the 0.0,1.0
-# crossings
-
-NUM_SAMPLES = 2**12+5
-RANGE = (-0.125, 1.125)
-data = []
-for i in xrange(NUM_SAMPLES):
-    x = i/(NUM_SAMPLES-1.0)
-    x = Fit(x, 0.0, 1.0, RANGE[0], RANGE[1])
-    data.append(fromCineon(x))
-
-# Data is srgb->linear
-WriteSPI1D('luts/cineon.spi1d', RANGE[0], RANGE[1], data)
-
-cs = OCIO.ColorSpace(name='Cineon')
-cs.setDescription("Cineon (Log Film Scan)")
-cs.setBitDepth(OCIO.Constants.BIT_DEPTH_F32)
-cs.setAllocation(OCIO.Constants.ALLOCATION_UNIFORM)
-cs.setAllocationVars([RANGE[0], RANGE[1]])
-
-t = OCIO.FileTransform('cineon.spi1d', interpolation=OCIO.Constants.INTERP_LINEAR)
-cs.setTransform(t, OCIO.Constants.COLORSPACE_DIR_TO_REFERENCE)
-config.addColorSpace(cs)
-
-
-
-###############################################################################
-
-cs = OCIO.ColorSpace(name='Gamma1.8')
-cs.setDescription("Emulates a idealized Gamma 1.8 display device.")
-cs.setBitDepth(OCIO.Constants.BIT_DEPTH_F32)
-cs.setAllocation(OCIO.Constants.ALLOCATION_UNIFORM)
-cs.setAllocationVars([0.0, 1.0])
-
-t = OCIO.ExponentTransform(value=(1.8,1.8,1.8,1.0))
-cs.setTransform(t, OCIO.Constants.COLORSPACE_DIR_TO_REFERENCE)
-config.addColorSpace(cs)
-
-cs = OCIO.ColorSpace(name='Gamma2.2')
-cs.setDescription("Emulates a idealized Gamma 2.2 display device.")
-cs.setBitDepth(OCIO.Constants.BIT_DEPTH_F32)
-cs.setAllocation(OCIO.Constants.ALLOCATION_UNIFORM)
-cs.setAllocationVars([0.0, 1.0])
+def fromCineon(x):
+    return (_exp(cineonScale * x + cineonOffset) - cineonBlackOffset) / (1.0 - cineonBlackOffset)
 
-t = OCIO.ExponentTransform(value=(2.2,2.2,2.2,1.0))
-cs.setTransform(t, OCIO.Constants.COLORSPACE_DIR_TO_REFERENCE)
-config.addColorSpace(cs)
+def fromCineon_vec(x):
+    return (np.exp(cineonScale * x + cineonOffset) - cineonBlackOffset) / (1.0 - cineonBlackOffset)
 
 
 ###############################################################################
@@ -222,34 +146,14 @@ config.addColorSpace(cs)
 
 panalogBlackOffset = 10.0 ** ((64.0 - 681.0) / 444.0)
 
-def fromPanalog(x):
-    return (10.0**((1023 * x - 681.0) / 444.0) - panalogBlackOffset) / (1.0 - panalogBlackOffset)
-
-# These samples and range have been chosen to write out this colorspace with
-# a limited over/undershoot range, which also exactly samples the 0.0,1.0
-# crossings
-
-NUM_SAMPLES = 2**12+5
-RANGE = (-0.125, 1.125)
-data = []
-for i in xrange(NUM_SAMPLES):
-    x = i/(NUM_SAMPLES-1.0)
-    x = Fit(x, 0.0, 1.0, RANGE[0], RANGE[1])
-    data.append(fromPanalog(x))
-
-# Data is srgb->linear
-WriteSPI1D('luts/panalog.spi1d', RANGE[0], RANGE[1], data)
-
-cs = OCIO.ColorSpace(name='Panalog')
-cs.setDescription("Sony/Panavision Genesis Log Space")
-cs.setBitDepth(OCIO.Constants.BIT_DEPTH_F32)
-cs.setAllocation(OCIO.Constants.ALLOCATION_UNIFORM)
-cs.setAllocationVars([RANGE[0], RANGE[1]])
+panalogScale = LN10 * 1023.0 / 444.0
+panalogOffset = LN10 * -681.0 / 444.0
 
-t = OCIO.FileTransform('panalog.spi1d', interpolation=OCIO.Constants.INTERP_LINEAR)
-cs.setTransform(t, OCIO.Constants.COLORSPACE_DIR_TO_REFERENCE)
-config.addColorSpace(cs)
+def fromPanalog(x):
+    return (_exp(panalogScale * x + panalogOffset) - panalogBlackOffset) / (1.0 - panalogBlackOffset)
 
+def fromPanalog_vec(x):
+    return (np.exp(panalogScale * x + panalogOffset) - panalogBlackOffset) / (1.0 - panalogBlackOffset)
 
 
 ###############################################################################
@@ -258,68 +162,26 @@ config.addColorSpace(cs)
 
 redBlackOffset = 10.0 ** ((0.0 - 1023.0) / 511.0)
 
-def fromREDLog(x):
-    return ((10.0 ** ((1023.0 * x - 1023.0) / 511.0)) - redBlackOffset) / (1.0 - redBlackOffset)
+redScale = LN10 * 1023.0 / 511.0
+redOffset = LN10 * -1023.0 / 511.0
 
-# These samples and range have been chosen to write out this colorspace with
-# a limited over/undershoot range, which also exactly samples the 0.0,1.0
-# crossings
-
-
-NUM_SAMPLES = 2**12+5
-RANGE = (-0.125, 1.125)
-data = []
-for i in xrange(NUM_SAMPLES):
-    x = i/(NUM_SAMPLES-1.0)
-    x = Fit(x, 0.0, 1.0, RANGE[0], RANGE[1])
-    data.append(fromREDLog(x))
-
-# Data is srgb->linear
-WriteSPI1D('luts/redlog.spi1d', RANGE[0], RANGE[1], data)
-
-cs = OCIO.ColorSpace(name='REDLog')
-cs.setDescription("RED Log Space")
-cs.setBitDepth(OCIO.Constants.BIT_DEPTH_F32)
-cs.setAllocation(OCIO.Constants.ALLOCATION_UNIFORM)
-cs.setAllocationVars([RANGE[0], RANGE[1]])
-
-t = OCIO.FileTransform('redlog.spi1d', interpolation=OCIO.Constants.INTERP_LINEAR)
-cs.setTransform(t, OCIO.Constants.COLORSPACE_DIR_TO_REFERENCE)
-config.addColorSpace(cs)
+def fromREDLog(x):
+    return (_exp(redScale * x + redOffset) - redBlackOffset) / (1.0 - redBlackOffset)
 
+def fromREDLog_vec(x):
+    return (np.exp(redScale * x + redOffset) - redBlackOffset) / (1.0 - redBlackOffset)
 
 
 ###############################################################################
 
-def fromViperLog(x):
-    return 10.0**((1023.0 * x - 1023.0) / 500.0)
-
-# These samples and range have been chosen to write out this colorspace with
-# a limited over/undershoot range, which also exactly samples the 0.0,1.0
-# crossings
+viperScale = LN10 * 1023.0 / 500.0
+viperOffset = LN10 * -1023.0 / 500.0
 
+def fromViperLog(x):
+    return _exp(viperScale * x + viperOffset)
 
-NUM_SAMPLES = 2**12+5
-RANGE = (-0.125, 1.125)
-data = []
-for i in xrange(NUM_SAMPLES):
-    x = i/(NUM_SAMPLES-1.0)
-    x = Fit(x, 0.0, 1.0, RANGE[0], RANGE[1])
-    data.append(fromViperLog(x))
-
-# Data is srgb->linear
-WriteSPI1D('luts/viperlog.spi1d', RANGE[0], RANGE[1], data)
-
-cs = OCIO.ColorSpace(name='ViperLog')
-cs.setDescription("Viper Log Space")
-cs.setBitDepth(OCIO.Constants.BIT_DEPTH_F32)
-cs.setAllocation(OCIO.Constants.ALLOCATION_UNIFORM)
-cs.setAllocationVars([RANGE[0], RANGE[1]])
-
-t = OCIO.FileTransform('viperlog.spi1d', interpolation=OCIO.Constants.INTERP_LINEAR)
-cs.setTransform(t, OCIO.Constants.COLORSPACE_DIR_TO_REFERENCE)
-config.addColorSpace(cs)
-
+def fromViperLog_vec(x):
+    return np.exp(viperScale * x + viperOffset)
 
 
 ###############################################################################
@@ -333,42 +195,23 @@ alexav3logc_e = 5.367655
 alexav3logc_f = 0.092809
 alexav3logc_cut = 0.010591
 alexav3logc_eCutF = alexav3logc_e*alexav3logc_cut + alexav3logc_f
+alexav3logc_scale = LN10 / alexav3logc_c
+alexav3logc_offset = LN10 * -alexav3logc_d / alexav3logc_c
 
 # This corresponds to EI800 per Arri Doc
 # http://www.arridigital.com/forum/index.php?topic=6372.0
 # http://www.arri.com/?eID=registration&file_uid=7775
 def fromAlexaV3LogC(x):
     if x > alexav3logc_eCutF:
-        return (10.0 **((x - alexav3logc_d) / alexav3logc_c) - alexav3logc_b) / alexav3logc_a
+        return (_exp(alexav3logc_scale * x + alexav3logc_offset) - alexav3logc_b) / alexav3logc_a
     else:
         return (x - alexav3logc_f) / alexav3logc_e
 
-
-# These samples and range have been chosen to write out this colorspace with
-# a limited over/undershoot range, which also exactly samples the 0.0,1.0
-# crossings
-
-
-NUM_SAMPLES = 2**12+5
-RANGE = (-0.125, 1.125)
-data = []
-for i in xrange(NUM_SAMPLES):
-    x = i/(NUM_SAMPLES-1.0)
-    x = Fit(x, 0.0, 1.0, RANGE[0], RANGE[1])
-    data.append(fromAlexaV3LogC(x))
-
-# Data is srgb->linear
-WriteSPI1D('luts/alexalogc.spi1d', RANGE[0], RANGE[1], data)
-
-cs = OCIO.ColorSpace(name='AlexaV3LogC')
-cs.setDescription("Alexa Log C")
-cs.setBitDepth(OCIO.Constants.BIT_DEPTH_F32)
-cs.setAllocation(OCIO.Constants.ALLOCATION_UNIFORM)
-cs.setAllocationVars([RANGE[0], RANGE[1]])
-
-t = OCIO.FileTransform('alexalogc.spi1d', interpolation=OCIO.Constants.INTERP_LINEAR)
-cs.setTransform(t, OCIO.Constants.COLORSPACE_DIR_TO_REFERENCE)
-config.addColorSpace(cs)
+def fromAlexaV3LogC_vec(x):
+    out = (x - alexav3logc_f) / alexav3logc_e
+    curve = x > alexav3logc_eCutF
+    out[curve] = (np.exp(alexav3logc_scale * x[curve] + alexav3logc_offset) - alexav3logc_b) / alexav3logc_a
+    return out
 
 
 ###############################################################################
@@ -383,66 +226,26 @@ negativeGamma = 0.6
 densityPerCodeValue = 0.002
 ngOverDpcv = negativeGamma/densityPerCodeValue
 dpcvOverNg = densityPerCodeValue/negativeGamma
+plogScale = LN10 * 1023.0 * dpcvOverNg
+plogOffset = LN10 * -logReference * dpcvOverNg
 
 def fromPLogLin(x):
-    return (10.0**((x*1023.0 - logReference)*dpcvOverNg ) * linReference)
-
-
-# These samples and range have been chosen to write out this colorspace with
-# a limited over/undershoot range, which also exactly samples the 0.0,1.0
-# crossings
-
-NUM_SAMPLES = 2**12+5
-RANGE = (-0.125, 1.125)
-data = []
-for i in xrange(NUM_SAMPLES):
-    x = i/(NUM_SAMPLES-1.0)
-    x = Fit(x, 0.0, 1.0, RANGE[0], RANGE[1])
-    data.append(fromPLogLin(x))
+    return _exp(plogScale * x + plogOffset) * linReference
 
-# Data is srgb->linear
-WriteSPI1D('luts/ploglin.spi1d', RANGE[0], RANGE[1], data)
-
-cs = OCIO.ColorSpace(name='PLogLin')
-cs.setDescription("Josh Pines style pivoted log/lin conversion. 445->0.18")
-cs.setBitDepth(OCIO.Constants.BIT_DEPTH_F32)
-cs.setAllocation(OCIO.Constants.ALLOCATION_UNIFORM)
-cs.setAllocationVars([RANGE[0], RANGE[1]])
-
-t = OCIO.FileTransform('ploglin.spi1d', interpolation=OCIO.Constants.INTERP_LINEAR)
-cs.setTransform(t, OCIO.Constants.COLORSPACE_DIR_TO_REFERENCE)
-config.addColorSpace(cs)
+def fromPLogLin_vec(x):
+    return np.exp(plogScale * x + plogOffset) * linReference
 
 
 ###############################################################################
 
-def fromSLog(x):
-    return (10.0 ** (((x - 0.616596 - 0.03) / 0.432699)) - 0.037584)
-
-# These samples and range have been chosen to write out this colorspace with
-# a limited over/undershoot range, which also exactly samples the 0.0,1.0
-# crossings
-
-NUM_SAMPLES = 2**12+5
-RANGE = (-0.125, 1.125)
-data = []
-for i in xrange(NUM_SAMPLES):
-    x = i/(NUM_SAMPLES-1.0)
-    x = Fit(x, 0.0, 1.0, RANGE[0], RANGE[1])
-    data.append(fromSLog(x))
-
-# Data is srgb->linear
-WriteSPI1D('luts/slog.spi1d', RANGE[0], RANGE[1], data)
+slogScale = LN10 / 0.432699
+slogOffset = LN10 * -(0.616596 + 0.03) / 0.432699
 
-cs = OCIO.ColorSpace(name='SLog')
-cs.setDescription("Sony SLog")
-cs.setBitDepth(OCIO.Constants.BIT_DEPTH_F32)
-cs.setAllocation(OCIO.Constants.ALLOCATION_UNIFORM)
-cs.setAllocationVars([RANGE[0], RANGE[1]])
+def fromSLog(x):
+    return _exp(slogScale * x + slogOffset) - 0.037584
 
-t = OCIO.FileTransform('slog.spi1d', interpolation=OCIO.Constants.INTERP_LINEAR)
-cs.setTransform(t, OCIO.Constants.COLORSPACE_DIR_TO_REFERENCE)
-config.addColorSpace(cs)
+def fromSLog_vec(x):
+    return np.exp(slogScale * x + slogOffset) - 0.037584
 
 
 ###############################################################################
@@ -453,37 +256,116 @@ config.addColorSpace(cs)
 
 ###############################################################################
 
-cs = OCIO.ColorSpace(name='raw')
-cs.setDescription("Raw Data. Used for normals, points, etc.")
-cs.setBitDepth(OCIO.Constants.BIT_DEPTH_F32)
-cs.setIsData(True)
-config.addColorSpace(cs)
-
+# A 1D LUT file, sampled from a transfer function that converts to linear.
+LUT = namedtuple('LUT', 'filename func func_vec numSamples range')
 
-###############################################################################
+# These samples and range have been chosen to write out the colorspaces with
+# a limited over/undershoot range, which also exactly samples the 0.0,1.0
+# crossings
+NUM_SAMPLES = 2**12+5
+RANGE = (-0.125, 1.125)
 
-display = 'default'
-config.addDisplay(display, 'None', 'raw')
-config.addDisplay(display, 'sRGB', 'sRGB')
-config.addDisplay(display, 'rec709', 'rec709')
+# The colorspaces other than 'linear' and 'raw', in config order: name,
+# description, and either a LUT or a display gamma.
+COLORSPACES = [
+    ('sRGB', "Standard RGB Display Space",
+     LUT('srgb.spi1d', fromSRGB, fromSRGB_vec, NUM_SAMPLES, RANGE)),
+    ('sRGBf', "Standard RGB Display Space, but with additional range to preserve float highlights.",
+     LUT('srgbf.spi1d', fromSRGB, fromSRGB_vec, 2**16+25, (-0.125, 4.875))),
+    ('rec709', "Rec. 709 (Full Range) Display Space",
+     LUT('rec709.spi1d', fromRec709, fromRec709_vec, NUM_SAMPLES, RANGE)),
+    ('Cineon', "Cineon (Log Film Scan)",
+     LUT('cineon.spi1d', fromCineon, fromCineon_vec, NUM_SAMPLES, RANGE)),
+    ('Gamma1.8', "Emulates a idealized Gamma 1.8 display device.", 1.8),
+    ('Gamma2.2', "Emulates a idealized Gamma 2.2 display device.", 2.2),
+    ('Panalog', "Sony/Panavision Genesis Log Space",
+     LUT('panalog.spi1d', fromPanalog, fromPanalog_vec, NUM_SAMPLES, RANGE)),
+    ('REDLog', "RED Log Space",
+     LUT('redlog.spi1d', fromREDLog, fromREDLog_vec, NUM_SAMPLES, RANGE)),
+    ('ViperLog', "Viper Log Space",
+     LUT('viperlog.spi1d', fromViperLog, fromViperLog_vec, NUM_SAMPLES, RANGE)),
+    ('AlexaV3LogC', "Alexa Log C",
+     LUT('alexalogc.spi1d', fromAlexaV3LogC, fromAlexaV3LogC_vec, NUM_SAMPLES, RANGE)),
+    ('PLogLin', "Josh Pines style pivoted log/lin conversion. 445->0.18",
+     LUT('ploglin.spi1d', fromPLogLin, fromPLogLin_vec, NUM_SAMPLES, RANGE)),
+    ('SLog', "Sony SLog",
+     LUT('slog.spi1d', fromSLog, fromSLog_vec, NUM_SAMPLES, RANGE)),
+]
 
-config.setActiveDisplays('default')
-config.setActiveViews('sRGB')
+# Data is srgb->linear
+def WriteLUT(lut):
+    data = Sample(lut.func, lut.func_vec, lut.numSamples, lut.range)
+    WriteSPI1D(os.path.join('luts', lut.filename), lut.range[0], lut.range[1], data)
 
 
 ###############################################################################
 
 
-
-try:
-    config.sanityCheck()
-except Exception,e:
-    print e
-
-f = file(outputfilename,"w")
-f.write(config.serialize())
-f.close()
-print "Wrote",outputfilename
+if __name__ == '__main__':
+    print("OCIO", OCIO.version)
+
+    # Each LUT is independent of the others, so compute and write them in
+    # parallel. The large sRGBf LUT overlaps with all of the smaller ones.
+    luts = [transform for (name, description, transform) in COLORSPACES
+            if isinstance(transform, LUT)]
+    with ProcessPoolExecutor() as executor:
+        list(executor.map(WriteLUT, luts))
+
+    config = OCIO.Config()
+    config.setSearchPath('luts')
+
+    config.setRole(OCIO.Constants.ROLE_SCENE_LINEAR, "linear")
+    config.setRole(OCIO.Constants.ROLE_REFERENCE, "linear")
+    config.setRole(OCIO.Constants.ROLE_COLOR_TIMING, "Cineon")
+    config.setRole(OCIO.Constants.ROLE_COMPOSITING_LOG, "Cineon")
+    config.setRole(OCIO.Constants.ROLE_DATA,"raw")
+    config.setRole(OCIO.Constants.ROLE_DEFAULT,"raw")
+    config.setRole(OCIO.Constants.ROLE_COLOR_PICKING,"sRGB")
+    config.setRole(OCIO.Constants.ROLE_MATTE_PAINT,"sRGB")
+    config.setRole(OCIO.Constants.ROLE_TEXTURE_PAINT,"sRGB")
+
+    cs = OCIO.ColorSpace(name='linear')
+    cs.setDescription("Scene-linear, high dynamic range. Used for rendering and compositing.")
+    cs.setBitDepth(OCIO.Constants.BIT_DEPTH_F32)
+    cs.setAllocation(OCIO.Constants.ALLOCATION_LG2)
+    cs.setAllocationVars([-15.0, 6.0])
+    config.addColorSpace(cs)
+
+    for (name, description, transform) in COLORSPACES:
+        cs = OCIO.ColorSpace(name=name)
+        cs.setDescription(description)
+        cs.setBitDepth(OCIO.Constants.BIT_DEPTH_F32)
+        cs.setAllocation(OCIO.Constants.ALLOCATION_UNIFORM)
+        if isinstance(transform, LUT):
+            cs.setAllocationVars([transform.range[0], transform.range[1]])
+            t = OCIO.FileTransform(transform.filename, interpolation=OCIO.Constants.INTERP_LINEAR)
+        else:
+            cs.setAllocationVars([0.0, 1.0])
+            t = OCIO.ExponentTransform(value=(transform, transform, transform, 1.0))
+        cs.setTransform(t, OCIO.Constants.COLORSPACE_DIR_TO_REFERENCE)
+        config.addColorSpace(cs)
+
+    cs = OCIO.ColorSpace(name='raw')
+    cs.setDescription("Raw Data. Used for normals, points, etc.")
+    cs.setBitDepth(OCIO.Constants.BIT_DEPTH_F32)
+    cs.setIsData(True)
+    config.addColorSpace(cs)
+
+    display = 'default'
+    config.addDisplay(display, 'None', 'raw')
+    config.addDisplay(display, 'sRGB', 'sRGB')
+    config.addDisplay(display, 'rec709', 'rec709')
+
+    config.setActiveDisplays('default')
+    config.setActiveViews('sRGB')
+
+    try:
+        config.sanityCheck()
+    except Exception as e:
+        print(e)
+
+    with open(outputfilename, "w") as f:
+        f.write(config.serialize())
+    print("Wrote", outputfilename)
 
 # Core/LUT/include/LUT/fnLUTConversions.h
-
@@ -5,9 +5,10 @@
 # https://github.com/AcademySoftwareFoundation/OpenImageIO
 
 
-# Make two images that differ by a particular known pixel value
-command += oiiotool("-pattern fill:color=0.1,0.1,0.1 64x64 3 -d float -o img1.exr")
-command += oiiotool("-pattern fill:color=0.1,0.1,0.1 64x64 3 -d float -box:fill=1:color=0.1,0.6,0.1 5,17,15,27 -o img2.exr")
+# Make two images that differ by a particular known pixel value. One
+# oiiotool run writes both: the plain fill, then the same image with a box.
+command += oiiotool("-pattern fill:color=0.1,0.1,0.1 64x64 3 -d float -o img1.exr "
+                    + "-box:fill=1:color=0.1,0.6,0.1 5,17,15,27 -o img2.exr")
 
 # Now make sure idiff and oiiotool --diff print the right info
 failureok = True
@@ -46,8 +46,7 @@ hashes = [
     "cshift.exr",
     "texture.exr"
 ]
-for file in hashes :
-    command += info_command(file, verbose=False)
+command += info_command(hashes, verbose=False)
 
 # outputs should contain all the images that need to be checked directly
 # and need the images checked into the ref directory.
@@ -4,16 +4,23 @@
 # SPDX-License-Identifier: Apache-2.0
 # https://github.com/AcademySoftwareFoundation/OpenImageIO
 
+import shutil
+
 redirect = " >> out.txt 2>&1 "
 
-# Prep:
-command += run_app("cmake -E copy " + test_source_dir + "/../common/grid-small.exr grid.exr")
-command += run_app("cmake -E copy " + test_source_dir + "/../common/tahoe-small.tif tahoe.tif")
+# Prep: stage the input images in-process rather than launching a cmake
+# process for each one.
+prep = [ ("grid-small.exr", "grid.exr"),
+         ("tahoe-small.tif", "tahoe.tif") ]
+for (src, dst) in prep :
+    shutil.copy2(os.path.join(test_source_dir, "..", "common", src), dst)
 
-# Run the examples for each chapter
-for chapter in [ "imageioapi", "imageoutput", "imageinput", "writingplugins",
-                 "imagecache", "texturesys", "imagebuf", "imagebufalgo" ] :
-    command += pythonbin + " src/docs-examples-" + chapter + ".py " + redirect + " ;"
+# Run the examples for each chapter. The chapters don't depend on each
+# other, so runchapters.py runs them concurrently and then prints their
+# output in this order.
+chapters = [ "imageioapi", "imageoutput", "imageinput", "writingplugins",
+             "imagecache", "texturesys", "imagebuf", "imagebufalgo" ]
+command += pythonbin + " src/runchapters.py " + " ".join(chapters) + redirect + " ;"
 
 # hashes merely check that the images don't change, but saves us the space
 # of checking in a full copy of the image if it's not needed.
@@ -38,8 +45,7 @@ hashes = [
     "cshift.exr",
     "texture.exr"
 ]
-for file in hashes :
-    command += info_command(file, verbose=False)
+command += info_command(hashes, verbose=False)
 
 # outputs should contain all the images that need to be checked directly
 # and need the images checked into the ref directory.
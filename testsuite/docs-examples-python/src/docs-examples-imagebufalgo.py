@@ -16,8 +16,7 @@
 
 # BEGIN-imagebufalgo-example1
 import OpenImageIO as oiio
-from OpenImageIO import *
-import numpy as np
+from OpenImageIO import ImageBuf, ImageBufAlgo, ImageSpec, ROI
 
 def example1() :
     #
@@ -36,6 +35,46 @@ def example1() :
 ############################################################################
 
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+
+# Several examples start by modifying a copy of one of the test images.
+# Decode each input file only once, and give each of those examples its own
+# in-memory copy of the pixels rather than re-reading the file.
+_decoded_images = {}
+
+def read_copy(filename):
+    buf = _decoded_images.get(filename)
+    if buf is None:
+        buf = ImageBuf(filename)
+        buf.read(force=True)
+        _decoded_images[filename] = buf
+    return buf.copy()
+
+
+# The examples' output images don't depend on each other, so rather than
+# writing each one as soon as it's made, queue them up and write them all
+# concurrently once every example has run (ImageBuf.write releases the GIL).
+_pending_writes = []
+
+def queue_write(buf, filename):
+    _pending_writes.append((buf, filename))
+
+def write_one(item):
+    buf, filename = item
+    return buf.write(filename)
+
+def flush_writes():
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = list(executor.map(write_one, _pending_writes))
+    # Report any failures in a deterministic order
+    for (buf, filename), ok in zip(_pending_writes, results):
+        if not ok:
+            print("error writing", filename, ":", buf.geterror())
+    _pending_writes.clear()
+
+
 # Section: ImageBufAlgo common principles
 
 def example_output_error1():
@@ -66,9 +105,9 @@ def example_output_error2():
 # Section: Pattern Generation
 
 def example_zero():
-    A = ImageBuf("grid.exr")
-    B = ImageBuf("grid.exr")
-    C = ImageBuf("grid.exr")
+    A = read_copy("grid.exr")
+    B = read_copy("grid.exr")
+    C = read_copy("grid.exr")
 
     # BEGIN-imagebufalgo-zero
     # Create a new 3-channel, 512x512 float image filled with 0.0 values.
@@ -87,10 +126,10 @@ def example_zero():
     ImageBufAlgo.zero(C, ROI(0, 100, 0, 100))
     # END-imagebufalgo-zero
 
-    zero.write("zero1.exr")
-    A.write("zero2.exr")
-    B.write("zero3.exr")
-    C.write("zero4.exr")
+    queue_write(zero, "zero1.exr")
+    queue_write(A, "zero2.exr")
+    queue_write(B, "zero3.exr")
+    queue_write(C, "zero4.exr")
 
 
 def example_fill():
@@ -106,21 +145,20 @@ def example_fill():
     ImageBufAlgo.fill(A, red, ROI(50, 100, 75, 175))
     # END-imagebufalgo-fill
 
-    A.write("fill.exr")
+    queue_write(A, "fill.exr")
 
 
 def example_checker():
     # BEGIN-imagebufalgo-checker
     # Create a new 640x480 RGB image, fill it with a two-toned gray
     # checkerboard, the checkers being 64x64 pixels each.
-    A = ImageBuf(ImageSpec(640, 480, 3, "float"))
     dark = (0.1, 0.1, 0.1)
     light = (0.4, 0.4, 0.4)
     A = ImageBufAlgo.checker(64, 64, 1, dark, light,
                              roi=ROI(0, 640, 0, 480, 0, 1, 0, 3))
     # END-imagebufalgo-checker
 
-    A.write("checker.exr")
+    queue_write(A, "checker.exr")
 
 
 def example_noise1():
@@ -142,10 +180,10 @@ def example_noise1():
     ImageBufAlgo.noise(D, "salt", A=0.0, B=0.01, mono=True, seed=1)
     # END-imagebufalgo-noise1
 
-    A.write("noise1.exr")
-    B.write("noise2.exr")
-    C.write("noise3.exr")
-    D.write("noise4.exr")
+    queue_write(A, "noise1.exr")
+    queue_write(B, "noise2.exr")
+    queue_write(C, "noise3.exr")
+    queue_write(D, "noise4.exr")
 
 
 def example_noise2():
@@ -153,7 +191,7 @@ def example_noise2():
     A = ImageBufAlgo.bluenoise_image()
     # END-imagebufalgo-noise2
 
-    A.write("blue-noise.exr")
+    queue_write(A, "blue-noise.exr")
 
 
 def example_point():
@@ -163,7 +201,7 @@ def example_point():
     ImageBufAlgo.render_point(A, 50, 100, red)
     # END-imagebufalgo-point
 
-    A.write("point.exr")
+    queue_write(A, "point.exr")
 
 
 def example_lines():
@@ -174,7 +212,7 @@ def example_lines():
     ImageBufAlgo.render_line(A, 250, 20, 100, 190, red, True)
     # END-imagebufalgo-lines
 
-    A.write("lines.exr")
+    queue_write(A, "lines.exr")
 
 
 def example_box():
@@ -186,12 +224,13 @@ def example_box():
     ImageBufAlgo.render_box(A, 100, 50, 180, 140, yellow_transparent, fill=True)
     # END-imagebufalgo-box
 
-    A.write("box.exr")
+    queue_write(A, "box.exr")
 
 
 def example_text1():
+    # Both text examples start from the same black image
     ImgA = ImageBufAlgo.zero(ROI(0, 640, 0, 480, 0, 1, 0, 3))
-    ImgB = ImageBufAlgo.zero(ROI(0, 640, 0, 480, 0, 1, 0, 3))
+    ImgB = ImgA.copy()
 
     # BEGIN-imagebufalgo-text1
     ImageBufAlgo.render_text(ImgA, 50, 100, "Hello, world")
@@ -205,8 +244,8 @@ def example_text1():
                              alignx="center", aligny="center")
     # END-imagebufalgo-text1
 
-    ImgA.write("text1.exr")
-    ImgB.write("text2.exr")
+    queue_write(ImgA, "text1.exr")
+    queue_write(ImgB, "text2.exr")
 
 
 def example_test2():
@@ -230,7 +269,7 @@ def example_circular_shift() :
     A = ImageBuf("grid.exr")
     B = ImageBufAlgo.circular_shift(A, 70, 30)
     # END-imagebufalgo-cshift
-    B.write("cshift.exr")
+    queue_write(B, "cshift.exr")
 
 
 # Section: Image Arithmetic
@@ -311,3 +350,5 @@ if __name__ == '__main__':
 
     # Section: Import / export
     example_make_texture()
+
+    flush_writes()
@@ -69,12 +69,13 @@ def scanlines_write() :
     out = oiio.ImageOutput.create (filename)
     if out:
         # BEGIN-imageoutput-scanlines
+        # Allocate one scanline's worth of pixels, reused for every row
+        scanline = np.zeros((xres, channels), dtype=np.uint8)
         z = 0   # Always zero for 2D images
         out.open (filename, spec)
         for y in range(yres) :
-            # Generate pixel array for one scanline.
-            # As an example, we are just making a zero-filled scanline
-            scanline = np.zeros((xres, channels), dtype=np.uint8)
+            # ... generate data in scanline[0:xres, 0:channels] ...
+            # As an example, we are just leaving the scanline zero-filled
             out.write_scanline (y, z, scanline)
         out.close ()
         # END-imageoutput-scanlines
@@ -0,0 +1,38 @@
+#!/usr/bin/env python
+
+# Copyright Contributors to the OpenImageIO project.
+# SPDX-License-Identifier: Apache-2.0
+# https://github.com/AcademySoftwareFoundation/OpenImageIO
+
+# Run the docs example scripts for each chapter named on the command line.
+# The chapters are independent of each other (they write different output
+# files), so they run concurrently, but their console output is printed in
+# the order the chapters were given so that out.txt stays deterministic.
+# Exits with an error if any chapter failed.
+
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+
+def run_chapter(chapter):
+    script = os.path.join(os.path.dirname(__file__),
+                          "docs-examples-" + chapter + ".py")
+    return subprocess.run([sys.executable, script],
+                          stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+
+
+if __name__ == '__main__':
+    chapters = sys.argv[1:]
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = list(executor.map(run_chapter, chapters))
+    err = 0
+    for chapter, result in zip(chapters, results):
+        sys.stdout.flush()
+        sys.stdout.buffer.write(result.stdout)
+        if result.returncode != 0:
+            print("Error: chapter", chapter, "failed with exit code",
+                  result.returncode)
+            err = 1
+    sys.exit(err)
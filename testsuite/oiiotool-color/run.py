@@ -9,28 +9,14 @@ import os
 
 # print("ociover =", ociover)
 
-# Make test pattern with increasing intensity left to right, decreasing
-# alpha going down. Carefully done so that the first pixel is 0.0, last
-# pixel is 1.0 (correcting for the half pixel offset).
-command += oiiotool ("-pattern fill:topleft=0,0,0,1:topright=1,1,1,1:bottomleft=0,0,0,0:bottomright=1,1,1,0 256x256 4 "
-                     + " -d uint8 -o greyalpha_lin_srgb.tif")
-command += oiiotool ("-pattern fill:topleft=0,0,0:topright=1,1,1:bottomleft=0,0,0:bottomright=1,1,1 256x256 3 "
-                     + " -d uint8 -o grey_lin_srgb.tif")
-
-
-# test --colormap
-command += oiiotool ("--autocc " + "../common/tahoe-tiny.tif" +
-                     " --colormap inferno " +
-                     "-d uint8 -o colormap-inferno.tif")
-command += oiiotool ("--autocc " + "../common/tahoe-tiny.tif" +
-                     " --colormap .25,.25,.25,0,.5,0,1,0,0 " +
-                     "-d uint8 -o colormap-custom.tif")
 
+# All the colormap ramps are made by one oiiotool run; each --pattern pushes
+# a fresh ramp for the next --colormap to replace.
 colormaps = [ "magma", "inferno", "plasma", "viridis", "turbo", "blue-red", "spectrum", "heat" ]
-for c in colormaps :
-    command += oiiotool ("--pattern fill:left=0,0,0:right=1,1,1 64x64 3" +
-                         " --colormap " + c +
-                         " -d uint8 -o cmap-" + c + ".tif")
+command += oiiotool (" ".join ("--pattern fill:left=0,0,0:right=1,1,1 64x64 3" +
+                               " --colormap " + c +
+                               " -d uint8 -o cmap-" + c + ".tif"
+                               for c in colormaps))
 
 # test unpremult/premult
 command += oiiotool ("--pattern constant:color=.1,.1,.1,1 100x100 4 " 
@@ -42,23 +28,29 @@ command += oiiotool ("unpremult.exr --premult -o premult.exr")
 # test --no-autopremult on a TGA file thet needs it.
 command += oiiotool ("--no-autopremult src/rgba.tga --ch R,G,B -o rgbfromtga.png")
 
-# test --contrast
-command += oiiotool ("--autocc " + "../common/tahoe-tiny.tif" +
-                     " -contrast:black=0.1:white=0.75 -d uint8 -o contrast-stretch.tif")
-command += oiiotool ("--autocc " + "../common/tahoe-tiny.tif" +
-                     " -contrast:min=0.1:max=0.75 -d uint8 -o contrast-shrink.tif")
-command += oiiotool ("--autocc " + "../common/tahoe-tiny.tif" +
-                     " -contrast:black=1:white=0 -d uint8 -o contrast-inverse.tif")
-command += oiiotool ("--autocc " + "../common/tahoe-tiny.tif" +
-                     " -contrast:black=1,1,.25:white=1,1,0.25 -d uint8 -o contrast-threshold.tif")
-command += oiiotool ("--autocc " + "../common/tahoe-tiny.tif" +
-                     " -contrast:scontrast=5 -d uint8 -o contrast-sigmoid5.tif")
-
-# test --saturate
-command += oiiotool ("--autocc " + "../common/tahoe-tiny.tif" +
-                     " --saturate 0 -d uint8 -o tahoe-sat0.tif")
-command += oiiotool ("--autocc " + "../common/tahoe-tiny.tif" +
-                     " --saturate 2 -d uint8 -o tahoe-sat2.tif")
+# test --ociolook, --colormap, --contrast, --saturate, and --ccmatrix on
+# tahoe-tiny, reading and auto-color-converting it only once and applying
+# each operation to a --dup of it, then popping the result. The look goes
+# first, because it is written without -d, which persists once given.
+tahoe_ops = []
+# Applying a look
+if float(ociover) >= 2.2 :
+    tahoe_ops += [ "--ociolook \"ACES 1.3 Reference Gamut Compression\" -o look-default.tif" ]
+tahoe_ops += [
+    "--colormap inferno -d uint8 -o colormap-inferno.tif",
+    "--colormap .25,.25,.25,0,.5,0,1,0,0 -d uint8 -o colormap-custom.tif",
+    "-contrast:black=0.1:white=0.75 -d uint8 -o contrast-stretch.tif",
+    "-contrast:min=0.1:max=0.75 -d uint8 -o contrast-shrink.tif",
+    "-contrast:black=1:white=0 -d uint8 -o contrast-inverse.tif",
+    "-contrast:black=1,1,.25:white=1,1,0.25 -d uint8 -o contrast-threshold.tif",
+    "-contrast:scontrast=5 -d uint8 -o contrast-sigmoid5.tif",
+    "--saturate 0 -d uint8 -o tahoe-sat0.tif",
+    "--saturate 2 -d uint8 -o tahoe-sat2.tif",
+    # test color convert by matrix
+    "--ccmatrix 0.805,0.506,-0.311,0,-0.311,0.805,0.506,0,0.506,-0.311,0.805,0,0,0,0,1 -d uint8 -o tahoe-ccmatrix.tif",
+]
+command += oiiotool ("--autocc ../common/tahoe-tiny.tif "
+                     + " --pop ".join ("--dup " + op for op in tahoe_ops))
 
 
 
@@ -66,35 +58,40 @@ command += oiiotool ("--autocc " + "../common/tahoe-tiny.tif" +
 # Test basic color transformation / OCIO functionality
 #
 
-# colorconvert without unpremult
+# Make test pattern with increasing intensity left to right, decreasing
+# alpha going down. Carefully done so that the first pixel is 0.0, last
+# pixel is 1.0 (correcting for the half pixel offset).
+greyalpha_pattern = "-pattern fill:topleft=0,0,0,1:topright=1,1,1,1:bottomleft=0,0,0,0:bottomright=1,1,1,0 256x256 4"
+grey_pattern = "-pattern fill:topleft=0,0,0:topright=1,1,1:bottomleft=0,0,0:bottomright=1,1,1 256x256 3"
+
+# Each test pattern is made, and all the color conversions and the display
+# transform are applied to it, by a single oiiotool run, so that the color
+# config is only loaded once per pattern. The pattern is written as uint8
+# and read back within that run, so the conversions see exactly the same
+# quantized pixels as if they had read the file separately. Each conversion
+# is applied to a --dup of it, then popped.
 if float(ociover) >= 2.2 :
-    command += oiiotool ("greyalpha_lin_srgb.tif --colorconvert:unpremult=0 lin_srgb sRGB -o greyalpha_sRGB.tif")
-    command += oiiotool ("greyalpha_lin_srgb.tif --colorconvert:unpremult=1 lin_srgb sRGB -o greyalpha_sRGB_un.tif")
-    command += oiiotool ("grey_lin_srgb.tif --colorconvert:unpremult=0 lin_srgb sRGB -o grey_sRGB.tif")
-    command += oiiotool ("grey_lin_srgb.tif --colorconvert:unpremult=1 lin_srgb sRGB -o grey_sRGB_un.tif")
+    command += oiiotool (greyalpha_pattern
+                         + " -d uint8 -o greyalpha_lin_srgb.tif greyalpha_lin_srgb.tif"
+                         + " --dup --colorconvert:unpremult=0 lin_srgb sRGB -o greyalpha_sRGB.tif --pop"
+                         + " --dup --colorconvert:unpremult=1 lin_srgb sRGB -o greyalpha_sRGB_un.tif --pop"
+                         + " --iscolorspace lin_srgb --ociodisplay \"sRGB - Display\" Un-tone-mapped -o display-sRGB.tif")
+    command += oiiotool (grey_pattern
+                         + " -d uint8 -o grey_lin_srgb.tif grey_lin_srgb.tif"
+                         + " --dup --colorconvert:unpremult=0 lin_srgb sRGB -o grey_sRGB.tif --pop"
+                         + " --colorconvert:unpremult=1 lin_srgb sRGB -o grey_sRGB_un.tif")
 else:
-    command += oiiotool ("greyalpha_lin_srgb.tif --colorconvert:unpremult=0 linear sRGB -o greyalpha_sRGB.tif")
-    command += oiiotool ("greyalpha_lin_srgb.tif --colorconvert:unpremult=0 linear Cineon -o greyalpha_Cineon.tif")
-    command += oiiotool ("greyalpha_lin_srgb.tif --colorconvert:unpremult=1 linear sRGB -o greyalpha_sRGB_un.tif")
-    command += oiiotool ("greyalpha_lin_srgb.tif --colorconvert:unpremult=1 linear Cineon -o greyalpha_Cineon_un.tif")
-    command += oiiotool ("grey_lin_srgb.tif --colorconvert:unpremult=0 linear sRGB -o grey_sRGB.tif")
-    command += oiiotool ("grey_lin_srgb.tif --colorconvert:unpremult=1 linear sRGB -o grey_sRGB_un.tif")
- 
-# test color convert by matrix
-command += oiiotool ("--autocc " + "../common/tahoe-tiny.tif"+
-                     " "
-                     + "--ccmatrix 0.805,0.506,-0.311,0,-0.311,0.805,0.506,0,0.506,-0.311,0.805,0,0,0,0,1 "
-                     + "-d uint8 -o tahoe-ccmatrix.tif")
-
-# Apply a display
-if float(ociover) >= 2.2 :
-    command += oiiotool ("greyalpha_lin_srgb.tif --iscolorspace lin_srgb --ociodisplay \"sRGB - Display\" Un-tone-mapped -o display-sRGB.tif")
-else :
-    command += oiiotool ("greyalpha_lin_srgb.tif --ociodisplay default sRGB -o display-sRGB.tif")
-
-# Applying a look
-if float(ociover) >= 2.2 :
-    command += oiiotool ("--autocc ../common/tahoe-tiny.tif --ociolook \"ACES 1.3 Reference Gamut Compression\" -o look-default.tif")
+    command += oiiotool (greyalpha_pattern
+                         + " -d uint8 -o greyalpha_lin_srgb.tif greyalpha_lin_srgb.tif"
+                         + " --dup --colorconvert:unpremult=0 linear sRGB -o greyalpha_sRGB.tif --pop"
+                         + " --dup --colorconvert:unpremult=0 linear Cineon -o greyalpha_Cineon.tif --pop"
+                         + " --dup --colorconvert:unpremult=1 linear sRGB -o greyalpha_sRGB_un.tif --pop"
+                         + " --dup --colorconvert:unpremult=1 linear Cineon -o greyalpha_Cineon_un.tif --pop"
+                         + " --ociodisplay default sRGB -o display-sRGB.tif")
+    command += oiiotool (grey_pattern
+                         + " -d uint8 -o grey_lin_srgb.tif grey_lin_srgb.tif"
+                         + " --dup --colorconvert:unpremult=0 linear sRGB -o grey_sRGB.tif --pop"
+                         + " --colorconvert:unpremult=1 linear sRGB -o grey_sRGB_un.tif")
 
 # TODO: should test applying a file transform
 
@@ -14,13 +14,13 @@
 redirect += " 2>&1"
 failureok = True
 
-# test expression substitution
+# test expression substitution. These only echo, and have no state or
+# errors, so they are all done by a single oiiotool run.
 command += oiiotool ('-echo "42+2 = {42+2}" ' +
                      '-echo "42-2 = {42-2}" ' +
                      '-echo "42*2 = {42*2}" ' +
-                     '-echo "42/2 = {42/2}"')
-
-command += oiiotool ('-echo "42<41 = {42<41}" ' +
+                     '-echo "42/2 = {42/2}" ' +
+                     '-echo "42<41 = {42<41}" ' +
                      '-echo "42<42 = {42<42}" ' +
                      '-echo "42<43 = {42<43}" ' +
                      '-echo "42<=41 = {42<=41}" ' +
@@ -40,9 +40,8 @@ command += oiiotool ('-echo "42<41 = {42<41}" ' +
                      '-echo "42!=43 = {42!=43}" ' +
                      '-echo "42<=>41 = {42<=>41}" ' +
                      '-echo "42<=>42 = {42<=>42}" ' +
-                     '-echo "42<=>43 = {42<=>43}" ')
-
-command += oiiotool ('-echo "(1==2)&&(2==2) = {(1==2)&&(2==2)}" ' +
+                     '-echo "42<=>43 = {42<=>43}" ' +
+                     '-echo "(1==2)&&(2==2) = {(1==2)&&(2==2)}" ' +
                      '-echo "(1==1)&&(2==2) = {(1==1)&&(2==2)}" ' +
                      '-echo "(1==2)&&(1==2) = {(1==2)&&(1==2)}" ' +
                      '-echo "(1==2)||(2==2) = {(1==2)||(2==2)}" ' +
@@ -51,15 +50,13 @@ command += oiiotool ('-echo "(1==2)&&(2==2) = {(1==2)&&(2==2)}" ' +
                      '-echo "not(1==1) = {not(1==1)}" ' +
                      '-echo "not(1==2) = {not(1==2)}" ' +
                      '-echo "!(1==1) = {!(1==1)}" ' +
-                     '-echo "!(1==2) = {!(1==2)}"')
-
-command += oiiotool ('-echo "eq(foo,foo) = {eq(\'foo\',\'foo\')}" ' +
+                     '-echo "!(1==2) = {!(1==2)}" ' +
+                     '-echo "eq(foo,foo) = {eq(\'foo\',\'foo\')}" ' +
                      '-echo "eq(foo,bar) = {eq(\'foo\',\'bar\')}" ' +
                      '-echo "neq(foo,foo) = {neq(\'foo\',\'foo\')}" ' +
-                     '-echo "neq(foo,bar) = {neq(\'foo\',\'bar\')}"')
-
-command += oiiotool ('-echo "16+5={16+5}" -echo "16-5={16-5}" -echo "16*5={16*5}"')
-command += oiiotool ('-echo "16/5={16/5}" -echo "16//5={16//5}" -echo "16%5={16%5}"')
+                     '-echo "neq(foo,bar) = {neq(\'foo\',\'bar\')}" ' +
+                     '-echo "16+5={16+5}" -echo "16-5={16-5}" -echo "16*5={16*5}" ' +
+                     '-echo "16/5={16/5}" -echo "16//5={16//5}" -echo "16%5={16%5}"')
 command += oiiotool ("../common/tahoe-small.tif --pattern fill:top=0,0,0,0:bottom=0,0,1,1 " +
                      "{TOP.geom} {TOP.nchannels} -d uint8 -o exprgradient.tif")
 command += oiiotool ('../common/tahoe-small.tif -cut "{TOP.width-20* 2}x{TOP.height-40+(4*2- 2 ) /6-1}+{TOP.x+100.5-80.5 }+{TOP.y+20}" -d uint8 -o exprcropped.tif')
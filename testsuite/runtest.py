@@ -232,9 +232,15 @@ def run_app(app, silent=False, concat=True):
 # Construct a command that will print info for an image, appending output to
 # the file "out.txt".  If 'safematch' is nonzero, it will exclude printing
 # of fields that tend to change from run to run or release to release.
+# 'file' may also be a list of files, which are then all printed, in order,
+# by a single invocation of the info program.
 def info_command (file, extraargs="", safematch=False, hash=True,
                   verbose=True, silent=False, concat=True, failureok=False,
                   info_program="oiiotool") :
+    if isinstance(file, (list, tuple)) :
+        files = " ".join([make_relpath(f,tmpdir) for f in file])
+    else :
+        files = make_relpath(file,tmpdir)
     args = ""
     if info_program == "oiiotool" :
         args += " --info"
@@ -245,7 +251,7 @@ def info_command (file, extraargs="", safematch=False, hash=True,
     if hash :
         args += " --hash"
     cmd = (oiio_app(info_program) + args + " " + extraargs
-            + " " + make_relpath(file,tmpdir))
+            + " " + files)
     if not silent :
         cmd += redirect
     if failureok :